@@ -31,8 +31,10 @@ import 'dart:math' as math;
 
 import 'package:args/args.dart';
 import 'package:test_reporter/src/utils/checklist_utils.dart';
+import 'package:test_reporter/src/utils/formatting_utils.dart';
 import 'package:test_reporter/src/utils/module_identifier.dart';
 import 'package:test_reporter/src/utils/path_resolver.dart';
+import 'package:test_reporter/src/utils/path_utils.dart';
 import 'package:test_reporter/src/utils/report_utils.dart';
 
 class CoverageThresholds {
@@ -121,6 +123,11 @@ class CoverageAnalyzer {
   final bool minimalChecklist;
   final bool includeFixtures;
   final List<String> excludePatterns;
+
+  // Exclude patterns compiled once on first use
+  late final List<RegExp> _excludeRegexes =
+      excludePatterns.map(RegExp.new).toList();
+
   final CoverageThresholds thresholds;
   final String? baselineFile;
   final String? saveBaseline; // Path to save current coverage as baseline
@@ -168,6 +175,12 @@ class CoverageAnalyzer {
   List<String> changedFiles = [];
   Map<String, int> mutationScore = {};
 
+  // pubspec.yaml probes (compiled once per process)
+  // A bare `flutter:` section or a `flutter: sdk:` dependency, in one scan
+  static final _flutterPattern =
+      RegExp(r'^\s*flutter:\s*$|flutter:\s*sdk:', multiLine: true);
+  static final _packageNamePattern = RegExp(r'^name:\s*(\S+)', multiLine: true);
+
   /// Detect if this is a Flutter project by checking pubspec.yaml
   bool get isFlutterProject {
     if (_isFlutterProject != null) return _isFlutterProject!;
@@ -182,9 +195,7 @@ class CoverageAnalyzer {
       final content = pubspecFile.readAsStringSync();
 
       // Check for flutter dependency
-      _isFlutterProject =
-          content.contains(RegExp(r'^\s*flutter:\s*$', multiLine: true)) ||
-              content.contains(RegExp(r'flutter:\s*sdk:', multiLine: true));
+      _isFlutterProject = content.contains(_flutterPattern);
 
       return _isFlutterProject!;
     } catch (e) {
@@ -592,10 +603,8 @@ class CoverageAnalyzer {
       // Real filesystem - production
       // Derive project root from test/lib paths
       final projectRoot = _getProjectRoot();
-      final reportsDir = Directory('$projectRoot/tests_reports/coverage');
-      if (!reportsDir.existsSync()) {
-        reportsDir.createSync(recursive: true);
-      }
+      Directory('$projectRoot/tests_reports/coverage')
+          .createSync(recursive: true);
 
       // Write markdown report
       final mdFile = File('$projectRoot/tests_reports/coverage/coverage_report@'
@@ -1024,45 +1033,87 @@ class CoverageAnalyzer {
     final packageName = await getPackageName();
     final projectRoot = Directory.current.path;
 
-    for (final file in testFiles) {
-      var content = await file.readAsString();
-      final originalContent = content;
-      var hasChanges = false;
-
-      // Find all import statements
-      final importRegex = RegExp(r'''import\s+['"](.*?)['"];''');
-      final matches = importRegex.allMatches(content).toList();
-
-      for (final match in matches.reversed) {
-        // Reverse to avoid index shifting
-        final importPath = match.group(1)!;
-
-        // Only process relative imports that point to files outside the current test structure
-        if (importPath.startsWith('../')) {
-          final fixedImport = await _resolveImportPath(
-            file.path,
-            importPath,
-            packageName,
-            projectRoot,
-          );
+    // Many test files import the same targets; probe each path only once
+    final existsCache = <String, bool>{};
 
-          if (fixedImport != null) {
-            content = content.replaceRange(
-              match.start,
-              match.end,
-              "import '$fixedImport';",
-            );
-            hasChanges = true;
-          }
-        }
+    // Files are independent, so rewrite them on a bounded set of workers.
+    // Report in discovery order with a single print; the finally block
+    // ensures files already rewritten are listed even if another file fails
+    final fixed = List.filled(testFiles.length, false);
+    try {
+      await _forEachInChunks(testFiles.length, (i) async {
+        fixed[i] = await _fixImportsInFile(
+          testFiles[i],
+          packageName,
+          projectRoot,
+          existsCache,
+        );
+      });
+    } finally {
+      final messages = [
+        for (var i = 0; i < testFiles.length; i++)
+          if (fixed[i]) '  ✅ Fixed imports in: ${testFiles[i].path}',
+      ];
+      if (messages.isNotEmpty) {
+        print(messages.join('\n'));
       }
+    }
+  }
+
+  // Import directive pattern (compiled once, applied per test file)
+  static final _importPattern = RegExp(r'''import\s+['"](.*?)['"];''');
+
+  /// Rewrite relative imports in a single test file
+  ///
+  /// Returns true if the file was changed and written back.
+  Future<bool> _fixImportsInFile(
+    File file,
+    String packageName,
+    String projectRoot,
+    Map<String, bool> existsCache,
+  ) async {
+    var content = await file.readAsString();
 
-      // Write back only if there were actual changes
-      if (hasChanges && content != originalContent) {
-        await file.writeAsString(content);
-        print('  ✅ Fixed imports in: ${file.path}');
+    // Most test files have no relative imports; skip the regex scan
+    if (!content.contains('../')) return false;
+
+    final originalContent = content;
+    var hasChanges = false;
+
+    // Find all import statements
+    final matches = _importPattern.allMatches(content).toList();
+
+    for (final match in matches.reversed) {
+      // Reverse to avoid index shifting
+      final importPath = match.group(1)!;
+
+      // Only process relative imports that point to files outside the current test structure
+      if (importPath.startsWith('../')) {
+        final fixedImport = await _resolveImportPath(
+          file.path,
+          importPath,
+          packageName,
+          projectRoot,
+          existsCache,
+        );
+
+        if (fixedImport != null) {
+          content = content.replaceRange(
+            match.start,
+            match.end,
+            "import '$fixedImport';",
+          );
+          hasChanges = true;
+        }
       }
     }
+
+    // Write back only if there were actual changes
+    if (hasChanges && content != originalContent) {
+      await file.writeAsString(content);
+      return true;
+    }
+    return false;
   }
 
   /// Resolve import path using proper path resolution algorithm
@@ -1071,6 +1122,7 @@ class CoverageAnalyzer {
     String importPath,
     String packageName,
     String projectRoot,
+    Map<String, bool> existsCache,
   ) async {
     try {
       // Get the directory containing the test file
@@ -1081,7 +1133,9 @@ class CoverageAnalyzer {
           _normalizePath(_joinPath(testFileDir, importPath));
 
       // Check if the file exists
-      if (!File(absoluteImportPath).existsSync()) {
+      final exists = existsCache.putIfAbsent(
+          absoluteImportPath, () => File(absoluteImportPath).existsSync());
+      if (!exists) {
         return null; // Don't modify imports to non-existent files
       }
 
@@ -1200,8 +1254,7 @@ class CoverageAnalyzer {
     if (!pubspecFile.existsSync()) return 'supaflow';
 
     final content = await pubspecFile.readAsString();
-    final nameMatch =
-        RegExp(r'^name:\s*(\S+)', multiLine: true).firstMatch(content);
+    final nameMatch = _packageNamePattern.firstMatch(content);
     return nameMatch?.group(1) ?? 'supaflow';
   }
 
@@ -1488,6 +1541,33 @@ class CoverageAnalyzer {
     }
   }
 
+  /// Run [action] for every index below [length] on a bounded set of workers
+  ///
+  /// Uses the same split as runParallelCoverage: indices are cut into one
+  /// contiguous chunk per worker and each worker awaits its chunk in order,
+  /// so at most that many files are open at once however large the project.
+  Future<void> _forEachInChunks(
+    int length,
+    Future<void> Function(int index) action,
+  ) async {
+    if (length == 0) return;
+
+    final numWorkers = math.min(Platform.numberOfProcessors, 4);
+    final chunkSize = (length / numWorkers).ceil();
+
+    final futures = <Future<void>>[];
+    for (var start = 0; start < length; start += chunkSize) {
+      final end = math.min(start + chunkSize, length);
+      futures.add(() async {
+        for (var i = start; i < end; i++) {
+          await action(i);
+        }
+      }());
+    }
+
+    await Future.wait(futures);
+  }
+
   Future<void> performManualAnalysis() async {
     print('  Performing manual coverage analysis...');
 
@@ -1503,11 +1583,18 @@ class CoverageAnalyzer {
       // Directory
       final sourceDir = Directory(libPath);
       if (sourceDir.existsSync()) {
-        await for (final file in sourceDir.list(recursive: true)) {
-          if (file is File && file.path.endsWith('.dart')) {
-            final analysis = await analyzeSourceFile(file);
-            sourceFiles[file.path] = analysis;
-          }
+        // Read and analyze files on a few workers; insert in listing order
+        final files = await sourceDir
+            .list(recursive: true)
+            .where((f) => f is File && f.path.endsWith('.dart'))
+            .cast<File>()
+            .toList();
+        final analyses = List<FileAnalysis?>.filled(files.length, null);
+        await _forEachInChunks(files.length, (i) async {
+          analyses[i] = await analyzeSourceFile(files[i]);
+        });
+        for (final analysis in analyses) {
+          sourceFiles[analysis!.path] = analysis;
         }
       }
     }
@@ -1524,11 +1611,17 @@ class CoverageAnalyzer {
       // Directory
       final testDir = Directory(testPath);
       if (testDir.existsSync()) {
-        await for (final file in testDir.list(recursive: true)) {
-          if (file is File && file.path.endsWith('_test.dart')) {
-            final analysis = await analyzeTestFile(file);
-            testFiles[file.path] = analysis;
-          }
+        final files = await testDir
+            .list(recursive: true)
+            .where((f) => f is File && f.path.endsWith('_test.dart'))
+            .cast<File>()
+            .toList();
+        final analyses = List<FileAnalysis?>.filled(files.length, null);
+        await _forEachInChunks(files.length, (i) async {
+          analyses[i] = await analyzeTestFile(files[i]);
+        });
+        for (final analysis in analyses) {
+          testFiles[analysis!.path] = analysis;
         }
       }
     }
@@ -1537,6 +1630,11 @@ class CoverageAnalyzer {
     matchTestedMethods();
   }
 
+  // Source/test scanning patterns (compiled once, applied per line)
+  static final _methodCallPattern = RegExp(r'(\w+)\s*\(');
+  static final _callExpressionPattern = RegExp(r'\w+\(.*\)');
+  static final _testDescriptionPattern = RegExp('test\\(["\']([^"\']+)["\']');
+
   Future<FileAnalysis> analyzeSourceFile(File file) async {
     final content = await file.readAsString();
     final lines = content.split('\n');
@@ -1556,7 +1654,7 @@ class CoverageAnalyzer {
         analysis.testableLines.add(lineNum);
 
         // Extract method names
-        final methodMatch = RegExp(r'(\w+)\s*\(').firstMatch(line);
+        final methodMatch = _methodCallPattern.firstMatch(line);
         if (methodMatch != null) {
           analysis.methods.add(methodMatch.group(1)!);
         }
@@ -1582,14 +1680,13 @@ class CoverageAnalyzer {
     final analysis = FileAnalysis(file.path);
 
     // Extract test descriptions and tested methods
-    final testRegex = RegExp('test\\(["\']([^"\']+)["\']');
-    final testMatches = testRegex.allMatches(content);
+    final testMatches = _testDescriptionPattern.allMatches(content);
     for (final match in testMatches) {
       analysis.testDescriptions.add(match.group(1)!);
     }
 
     // Extract method calls
-    final methodCalls = RegExp(r'(\w+)\s*\(').allMatches(content);
+    final methodCalls = _methodCallPattern.allMatches(content);
     for (final match in methodCalls) {
       analysis.testedMethods.add(match.group(1)!);
     }
@@ -1612,20 +1709,30 @@ class CoverageAnalyzer {
         line.contains('catch') ||
         line.contains('switch') ||
         line.contains('=') && !line.startsWith('final') ||
-        RegExp(r'\w+\(.*\)').hasMatch(line);
+        _callExpressionPattern.hasMatch(line);
   }
 
   void matchTestedMethods() {
     print('\n🔗 Matching tested methods...');
 
-    for (final sourceFile in sourceFiles.values) {
-      final baseName = sourceFile.path.split('/').last.replaceAll('.dart', '');
-      final testFileName = '${baseName}_test.dart';
+    // A source file's test is the first test file (in iteration order) whose
+    // name ends with `<base>_test.dart`, so `foo.dart` matches both
+    // `foo_test.dart` and a prefixed `my_foo_test.dart`. Index every name
+    // suffix ending in `_test.dart` up front, keeping the first file for
+    // each, so that rule is a single map lookup per source file instead of
+    // a scan over all test files.
+    final testFilesBySuffix = <String, FileAnalysis>{};
+    for (final tf in testFiles.values) {
+      final fileName = _fileNameOf(tf.path);
+      if (!fileName.endsWith(_testFileSuffix)) continue;
+      for (var i = 0; i <= fileName.length - _testFileSuffix.length; i++) {
+        testFilesBySuffix.putIfAbsent(fileName.substring(i), () => tf);
+      }
+    }
 
-      final testFile = testFiles.values.firstWhere(
-        (tf) => tf.path.endsWith(testFileName),
-        orElse: () => FileAnalysis(''),
-      );
+    for (final sourceFile in sourceFiles.values) {
+      final testFile = testFilesBySuffix[_testFileNameFor(sourceFile.path)] ??
+          FileAnalysis('');
 
       if (testFile.path.isNotEmpty) {
         // Check which methods are tested
@@ -1637,12 +1744,13 @@ class CoverageAnalyzer {
 
         // Check catch blocks
         if (sourceFile.catchBlocks.isNotEmpty) {
-          final hasErrorTests = testFile.testDescriptions.any(
-            (desc) =>
-                desc.toLowerCase().contains('error') ||
-                desc.toLowerCase().contains('exception') ||
-                desc.toLowerCase().contains('catch'),
-          );
+          final hasErrorTests = testFile.testDescriptions.any((desc) {
+            // Lowercase once per description rather than once per keyword
+            final descLower = desc.toLowerCase();
+            return descLower.contains('error') ||
+                descLower.contains('exception') ||
+                descLower.contains('catch');
+          });
 
           if (!hasErrorTests) {
             print('  ⚠️  Catch blocks not tested in ${sourceFile.path}');
@@ -1666,9 +1774,7 @@ class CoverageAnalyzer {
     // Create timestamp early for use throughout the report
     final now = DateTime.now();
     // Use simplified timestamp format: HHMM_DDMMYY
-    final simpleTimestamp =
-        '${now.hour.toString().padLeft(2, '0')}${now.minute.toString().padLeft(2, '0')}_'
-        '${now.day.toString().padLeft(2, '0')}${now.month.toString().padLeft(2, '0')}${now.year.toString().substring(2)}';
+    final simpleTimestamp = FormattingUtils.formatTimestamp(now);
 
     // Extract qualified module name from test path (or use explicit override)
     // If explicit name provided, qualify it based on path type
@@ -2360,12 +2466,36 @@ class CoverageAnalyzer {
     }
   }
 
+  static const _testFileSuffix = '_test.dart';
+
+  /// Last `/`-separated segment of [path], sliced without splitting the
+  /// whole path into a list
+  static String _fileNameOf(String path) =>
+      path.substring(path.lastIndexOf('/') + 1);
+
+  /// Test file name for a source path (`lib/a/foo.dart` -> `foo_test.dart`)
+  ///
+  /// Slices the file name and strips the `.dart` suffix once rather than
+  /// splitting the path and rescanning it with replaceAll.
+  static String _testFileNameFor(String sourcePath) {
+    final fileName = _fileNameOf(sourcePath);
+    final baseName = fileName.endsWith('.dart')
+        ? fileName.substring(0, fileName.length - '.dart'.length)
+        : fileName;
+    return '$baseName$_testFileSuffix';
+  }
+
+  // Header written above generated tests; the marker line doubles as the
+  // check that a file already has them
+  static const _generatedTestsMarker = 'Additional tests for uncovered lines';
+  static const _generatedTestsHeader =
+      '// $_generatedTestsMarker\n// Generated by coverage_tool.dart\n\n';
+
   Future<File?> generateTestsForFile(
     File sourceFile,
     List<int> uncoveredLines,
   ) async {
-    final fileName = sourceFile.path.split('/').last;
-    final testFileName = fileName.replaceAll('.dart', '_test.dart');
+    final testFileName = _testFileNameFor(sourceFile.path);
     final testFilePath = '$testPath/$testFileName';
 
     final testFile = File(testFilePath);
@@ -2374,14 +2504,18 @@ class CoverageAnalyzer {
       await testFile.create(recursive: true);
     }
 
+    // Generated tests are appended once; skip reading the source and
+    // building the template when a previous run already did so
+    final existingContent = await testFile.readAsString();
+    if (existingContent.contains(_generatedTestsMarker)) {
+      return testFile;
+    }
+
     // Read source to understand what needs testing
     final sourceContent = await sourceFile.readAsString();
     final sourceLines = sourceContent.split('\n');
 
-    final testContent = StringBuffer();
-    testContent.writeln('// Additional tests for uncovered lines');
-    testContent.writeln('// Generated by coverage_tool.dart');
-    testContent.writeln();
+    final testContent = StringBuffer(_generatedTestsHeader);
 
     for (final lineNum in uncoveredLines) {
       if (lineNum <= sourceLines.length) {
@@ -2407,10 +2541,7 @@ class CoverageAnalyzer {
     }
 
     // Append to existing test file
-    final existingContent = await testFile.readAsString();
-    if (!existingContent.contains('Additional tests for uncovered lines')) {
-      await testFile.writeAsString('$existingContent\n$testContent');
-    }
+    await testFile.writeAsString('$existingContent\n$testContent');
 
     return testFile;
   }
@@ -2523,8 +2654,8 @@ class CoverageAnalyzer {
 
   /// Check if file should be excluded from coverage
   bool shouldExclude(String filePath) {
-    for (final pattern in excludePatterns) {
-      if (RegExp(pattern).hasMatch(filePath)) {
+    for (final regex in _excludeRegexes) {
+      if (regex.hasMatch(filePath)) {
         return true;
       }
     }
@@ -2774,25 +2905,14 @@ class CoverageAnalyzer {
     json['files'] = filesMap;
 
     // Save JSON report in test_coverages folder
-    final reportsDir = Directory('analyzer/reports/test_coverages');
-    if (!await reportsDir.exists()) {
-      await reportsDir.create(recursive: true);
-    }
+    await Directory('analyzer/reports/test_coverages').create(recursive: true);
 
     final now = DateTime.now();
     // Use simplified timestamp format: HHMM_DDMMYY for consistency
-    final simpleTimestamp =
-        '${now.hour.toString().padLeft(2, '0')}${now.minute.toString().padLeft(2, '0')}_'
-        '${now.day.toString().padLeft(2, '0')}${now.month.toString().padLeft(2, '0')}${now.year.toString().substring(2)}';
+    final simpleTimestamp = FormattingUtils.formatTimestamp(now);
 
-    // Extract meaningful name from tested path (same logic as in generateCoverageReport)
-    var pathName = testPath.replaceAll('/', '_').replaceAll(r'\', '_');
-    if (pathName.startsWith('test_')) {
-      pathName = pathName.substring(5);
-    }
-    if (pathName.endsWith('_')) {
-      pathName = pathName.substring(0, pathName.length - 1);
-    }
+    // Extract meaningful name from tested path
+    final pathName = PathUtils.extractPathName(testPath);
 
     final jsonFile = File(
       'analyzer/reports/test_coverages/${pathName}_data@$simpleTimestamp.json',
@@ -2887,30 +3007,30 @@ class FileAnalysis {
 
 /// Prints usage information with ArgParser-generated help text
 void _printUsage(ArgParser parser) {
-  print('Usage: analyze_coverage [options] [module_path]');
-  print('');
-  print('Options:');
-  print(parser.usage);
-  print('');
-  print('Examples:');
-  print('  # Basic usage');
-  print('  analyze_coverage lib/src');
-  print('');
-  print('  # With auto-fix');
-  print('  analyze_coverage lib/src/core --fix');
-  print('');
-  print('  # Coverage thresholds');
-  print('  analyze_coverage lib/src --min-coverage=80 --warn-coverage=60');
-  print('');
-  print('  # Exclude generated files');
-  print(
-      '  analyze_coverage lib/src --exclude "*.g.dart" --exclude "*.freezed.dart"');
-  print('');
-  print('  # Full analysis with verbose output');
-  print('  analyze_coverage lib/src --fix --json --min-coverage=80 --verbose');
-  print('');
-  print('  # Using as project dependency');
-  print('  dart run test_reporter:analyze_coverage lib/src --fix');
+  print('''
+Usage: analyze_coverage [options] [module_path]
+
+Options:
+${parser.usage}
+
+Examples:
+  # Basic usage
+  analyze_coverage lib/src
+
+  # With auto-fix
+  analyze_coverage lib/src/core --fix
+
+  # Coverage thresholds
+  analyze_coverage lib/src --min-coverage=80 --warn-coverage=60
+
+  # Exclude generated files
+  analyze_coverage lib/src --exclude "*.g.dart" --exclude "*.freezed.dart"
+
+  # Full analysis with verbose output
+  analyze_coverage lib/src --fix --json --min-coverage=80 --verbose
+
+  # Using as project dependency
+  dart run test_reporter:analyze_coverage lib/src --fix''');
 }
 
 /// Creates and configures the ArgParser for analyze_coverage
@@ -400,29 +400,28 @@ class TestOrchestrator {
         return null;
       }
 
-      final files = <FileSystemEntity>[];
+      // Single pass: stat each match once and keep the most recent
+      File? latest;
+      DateTime? latestModified;
       await for (final file in dir.list()) {
         if (verbose) print('  📄 Found file: ${file.path}');
         if (file is File && file.path.contains(prefix)) {
           if (verbose) print('  ✅ File matches prefix: ${file.path}');
-          files.add(file);
+          final modified = (await file.stat()).modified;
+          if (latestModified == null || modified.isAfter(latestModified)) {
+            latest = file;
+            latestModified = modified;
+          }
         }
       }
 
-      if (files.isEmpty) {
+      if (latest == null) {
         if (verbose) print('  ⚠️  No files found matching prefix: $prefix');
         return null;
       }
 
-      // Sort by modification time, most recent first
-      files.sort((a, b) {
-        final aStat = (a as File).statSync();
-        final bStat = (b as File).statSync();
-        return bStat.modified.compareTo(aStat.modified);
-      });
-
-      if (verbose) print('  📋 Selected latest report: ${files.first.path}');
-      return files.first.path;
+      if (verbose) print('  📋 Selected latest report: ${latest.path}');
+      return latest.path;
     } catch (e) {
       if (verbose) print('  ⚠️  Could not find latest report: $e');
       return null;
@@ -1025,25 +1024,30 @@ class TestOrchestrator {
 
   void printSummary(
       {required bool coverageSuccess, required bool analyzerSuccess}) {
-    print('\n${"═" * 70}');
-    print('   SUMMARY');
-    print('${"═" * 70}\n');
+    // Assemble the whole summary and emit it with a single print call
+    final summary = StringBuffer()
+      ..writeln('\n${"═" * 70}')
+      ..writeln('   SUMMARY')
+      ..writeln('${"═" * 70}\n');
 
     if (coverageSuccess && analyzerSuccess) {
-      print('✅ All tools completed successfully!');
+      summary.writeln('✅ All tools completed successfully!');
     } else {
-      print('⚠️  Some tools encountered issues:');
-      if (!coverageSuccess) print('  - Coverage Tool: Failed');
-      if (!analyzerSuccess) print('  - Test Analyzer: Failed');
+      summary.writeln('⚠️  Some tools encountered issues:');
+      if (!coverageSuccess) summary.writeln('  - Coverage Tool: Failed');
+      if (!analyzerSuccess) summary.writeln('  - Test Analyzer: Failed');
     }
 
-    print('\n📊 Results:');
-    print('  - Tools run: 2');
-    print('  - Tools succeeded: ${coverageSuccess && analyzerSuccess ? 2 : 1}');
-    print('  - Tools failed: ${failures.length}');
+    summary
+      ..writeln('\n📊 Results:')
+      ..writeln('  - Tools run: 2')
+      ..writeln(
+          '  - Tools succeeded: ${coverageSuccess && analyzerSuccess ? 2 : 1}')
+      ..writeln('  - Tools failed: ${failures.length}')
+      ..writeln('\n📁 Reports saved to: tests_reports/');
 
-    print('\n📁 Reports saved to: tests_reports/');
-    print('');
+    // print() adds the final newline (matches the former trailing print(''))
+    print(summary);
   }
 
   /// Calculate overall health score (0-100)
@@ -56,6 +56,7 @@ import 'dart:io';
 import 'dart:math' as math;
 
 import 'package:args/args.dart';
+import 'package:test_reporter/src/utils/formatting_utils.dart';
 import 'package:test_reporter/src/utils/module_identifier.dart';
 import 'package:test_reporter/src/utils/report_utils.dart';
 
@@ -218,6 +219,41 @@ class TestAnalyzer {
   // Getter for watchMode (alias for watch)
   bool get watchMode => watch;
 
+  // Project type detection (pubspec.yaml is read at most once per analyzer)
+  Future<bool>? _isFlutterProject;
+
+  /// Whether the current project is a Flutter project (cached)
+  Future<bool> _detectFlutterProject() {
+    return _isFlutterProject ??= () async {
+      final pubspec = File('pubspec.yaml');
+      return await pubspec.exists() &&
+          (await pubspec.readAsString()).contains('flutter:');
+    }();
+  }
+
+  // Failure-output patterns used by detectFailureType,
+  // _detectFailurePattern and _generateSmartSuggestion (compiled once,
+  // reused for every output and failure)
+  static final _stackFramePattern = RegExp(r'#\d+.*?\n', multiLine: true);
+  static final _rangeIndexPattern = RegExp(r'range\s+\d+\.\.\d+:\s*(\d+)');
+  static final _pathPattern = RegExp(r"path\s*=\s*'([^']+)'");
+  static final _urlPattern = RegExp(r"'([^']+\.(com|org|net|io))'");
+  static final _locationPattern = RegExp(r'at (\S+\.dart:\d+)');
+  static final _durationPattern = RegExp(r'(\d+)\s*seconds?');
+  static final _subtypePattern =
+      RegExp(r"type '(\w+)' is not a subtype.*?'(\w+)'");
+  static final _expectedLinePattern =
+      RegExp(r'Expected[:\s]+([^\n]+)', caseSensitive: false);
+  static final _actualLinePattern =
+      RegExp(r'Actual[:\s]+([^\n]+)', caseSensitive: false);
+  static final _expectedValuePattern =
+      RegExp(r'expected[: ]+(.+?)(?:,|$)', caseSensitive: false);
+  static final _actualValuePattern =
+      RegExp(r'actual[: ]+(.+?)(?:,|$)', caseSensitive: false);
+  static final _nullCallPattern = RegExp(r"'(\w+)' was called on null");
+  static final _indexPattern = RegExp(r'index[: ]+(\d+)');
+  static final _userFramePattern = RegExp(r'(\w+\.dart):(\d+):(\d+)');
+
   /// Detects failure type from test output string
   FailureDetectionResult detectFailureType(String output) {
     final lowerOutput = output.toLowerCase();
@@ -227,21 +263,20 @@ class TestAnalyzer {
     Map<String, String> details = {};
 
     // Extract stack trace
-    final stackTraceMatch = RegExp(r'#\d+.*?\n', multiLine: true);
-    final stackMatches = stackTraceMatch.allMatches(output);
+    final stackMatches = _stackFramePattern.allMatches(output);
     if (stackMatches.isNotEmpty) {
       stackTrace = stackMatches.map((m) => m.group(0)).join();
     }
 
     // Check for specific exception types first (before generic patterns)
-    final firstLine = output.split('\n').first;
+    final outputLines = output.split('\n');
+    final firstLine = outputLines.first;
 
     // Detect range errors
     if (lowerOutput.contains('rangeerror')) {
       type = FailurePatternType.rangeError;
       // Match pattern like "range 0..2: 5" - capture the number after the colon
-      final indexMatch =
-          RegExp(r'range\s+\d+\.\.\d+:\s*(\d+)').firstMatch(output);
+      final indexMatch = _rangeIndexPattern.firstMatch(output);
       errorMessage = firstLine;
       if (indexMatch != null) {
         details['index'] = indexMatch.group(1)!;
@@ -251,7 +286,7 @@ class TestAnalyzer {
     else if (lowerOutput.contains('filesystemexception') ||
         lowerOutput.contains('cannot open file')) {
       type = FailurePatternType.fileSystemError;
-      final pathMatch = RegExp(r"path\s*=\s*'([^']+)'").firstMatch(output);
+      final pathMatch = _pathPattern.firstMatch(output);
       errorMessage = firstLine;
       if (pathMatch != null) {
         details['path'] = pathMatch.group(1)!;
@@ -260,8 +295,7 @@ class TestAnalyzer {
     // Detect network errors
     else if (lowerOutput.contains('socketexception')) {
       type = FailurePatternType.networkError;
-      final urlMatch =
-          RegExp(r"'([^']+\.(com|org|net|io))'").firstMatch(output);
+      final urlMatch = _urlPattern.firstMatch(output);
       errorMessage = firstLine;
       if (urlMatch != null) {
         details['url'] = urlMatch.group(1)!;
@@ -271,12 +305,12 @@ class TestAnalyzer {
     else if (lowerOutput.contains('nosuchmethoderror') &&
         lowerOutput.contains('null')) {
       type = FailurePatternType.nullError;
-      final varMatch = RegExp(r"'(\w+)' was called on null").firstMatch(output);
+      final varMatch = _nullCallPattern.firstMatch(output);
       errorMessage = firstLine;
       if (varMatch != null) {
         details['variableName'] = varMatch.group(1)!;
       }
-      final locationMatch = RegExp(r'at (\S+\.dart:\d+)').firstMatch(output);
+      final locationMatch = _locationPattern.firstMatch(output);
       if (locationMatch != null) {
         details['location'] = locationMatch.group(1)!;
       }
@@ -285,8 +319,8 @@ class TestAnalyzer {
     else if (lowerOutput.contains('timeout') ||
         lowerOutput.contains('timed out')) {
       type = FailurePatternType.timeout;
-      final durationMatch = RegExp(r'(\d+)\s*seconds?').firstMatch(output);
-      errorMessage = output.split('\n').firstWhere(
+      final durationMatch = _durationPattern.firstMatch(output);
+      errorMessage = outputLines.firstWhere(
           (line) => line.toLowerCase().contains('timeout'),
           orElse: () => firstLine);
       if (durationMatch != null) {
@@ -297,8 +331,7 @@ class TestAnalyzer {
     else if (lowerOutput.contains('type') &&
         (lowerOutput.contains('subtype') || lowerOutput.contains('cast'))) {
       type = FailurePatternType.typeError;
-      final typeMatch =
-          RegExp(r"type '(\w+)' is not a subtype.*?'(\w+)'").firstMatch(output);
+      final typeMatch = _subtypePattern.firstMatch(output);
       errorMessage = firstLine;
       if (typeMatch != null) {
         details['actualType'] = typeMatch.group(1)!;
@@ -310,12 +343,9 @@ class TestAnalyzer {
             lowerOutput.contains('actual:')) ||
         (lowerOutput.contains('expected user'))) {
       type = FailurePatternType.assertion;
-      final expectedMatch =
-          RegExp(r'Expected[:\s]+([^\n]+)', caseSensitive: false)
-              .firstMatch(output);
-      final actualMatch = RegExp(r'Actual[:\s]+([^\n]+)', caseSensitive: false)
-          .firstMatch(output);
-      errorMessage = output.split('\n').firstWhere(
+      final expectedMatch = _expectedLinePattern.firstMatch(output);
+      final actualMatch = _actualLinePattern.firstMatch(output);
+      errorMessage = outputLines.firstWhere(
           (line) => line.contains('Expected'),
           orElse: () => firstLine);
       if (expectedMatch != null)
@@ -377,18 +407,19 @@ class TestAnalyzer {
       case FailurePatternType.nullError:
         final varName = pattern.details['variableName'] ?? 'variable';
         final location = pattern.details['location'] ?? '';
-        var suggestion =
-            'Add null checks for $varName before accessing properties';
+        final suggestion = StringBuffer(
+            'Add null checks for $varName before accessing properties');
         if (location.isNotEmpty) {
-          suggestion += ' at $location';
+          suggestion.write(' at $location');
         }
         if (varName.isNotEmpty) {
-          suggestion += '\n\nConsider:\n';
-          suggestion += 'if ($varName != null) { ... }\n';
-          suggestion += 'or use: $varName?.property\n';
-          suggestion += 'or use: $varName ?? defaultValue';
+          suggestion
+            ..write('\n\nConsider:\n')
+            ..write('if ($varName != null) { ... }\n')
+            ..write('or use: $varName?.property\n')
+            ..write('or use: $varName ?? defaultValue');
         }
-        return suggestion;
+        return suggestion.toString();
 
       case FailurePatternType.timeout:
         final duration = pattern.details['duration'] ?? 'timeout';
@@ -622,10 +653,7 @@ class TestAnalyzer {
     final stopwatch = Stopwatch()..start();
 
     // Use flutter test for Flutter projects, dart test for pure Dart
-    final isFlutterProject = await File('pubspec.yaml').exists() &&
-        await File('pubspec.yaml')
-            .readAsString()
-            .then((content) => content.contains('flutter:'));
+    final isFlutterProject = await _detectFlutterProject();
 
     // Build test arguments - exclude fixtures by default unless --include-fixtures is used
     final testArgs = ['test', '--reporter=json', '--run-skipped'];
@@ -845,12 +873,8 @@ class TestAnalyzer {
       category = 'Assertion Failure';
 
       // Extract expected vs actual values
-      final expectedMatch =
-          RegExp(r'expected[: ]+(.+?)(?:,|$)', caseSensitive: false)
-              .firstMatch(failure.error);
-      final actualMatch =
-          RegExp(r'actual[: ]+(.+?)(?:,|$)', caseSensitive: false)
-              .firstMatch(failure.error);
+      final expectedMatch = _expectedValuePattern.firstMatch(failure.error);
+      final actualMatch = _actualValuePattern.firstMatch(failure.error);
 
       if (expectedMatch != null && actualMatch != null) {
         suggestion =
@@ -861,8 +885,7 @@ class TestAnalyzer {
       category = 'Null Reference Error';
 
       // Extract the property/method that was null
-      final propertyMatch =
-          RegExp(r"'(\w+)' was called on null").firstMatch(failure.error);
+      final propertyMatch = _nullCallPattern.firstMatch(failure.error);
       if (propertyMatch != null) {
         suggestion =
             'Add null check for ${propertyMatch.group(1)} or ensure proper initialization';
@@ -876,7 +899,7 @@ class TestAnalyzer {
       category = 'Range/Index Error';
 
       // Extract index information
-      final indexMatch = RegExp(r'index[: ]+(\d+)').firstMatch(failure.error);
+      final indexMatch = _indexPattern.firstMatch(failure.error);
       if (indexMatch != null) {
         suggestion =
             'Check array bounds before accessing index ${indexMatch.group(1)}';
@@ -916,7 +939,7 @@ class TestAnalyzer {
       if (line.contains('.dart:') &&
           !line.contains('package:') &&
           !line.contains('dart:')) {
-        final match = RegExp(r'(\w+\.dart):(\d+):(\d+)').firstMatch(line);
+        final match = _userFramePattern.firstMatch(line);
         if (match != null) {
           return 'Check ${match.group(1)} at line ${match.group(2)}';
         }
@@ -2625,10 +2648,7 @@ class TestAnalyzer {
     print('\n${yellow}Re-running test...$reset');
 
     // Use flutter test for Flutter projects, dart test for pure Dart
-    final isFlutterProject = await File('pubspec.yaml').exists() &&
-        await File('pubspec.yaml')
-            .readAsString()
-            .then((content) => content.contains('flutter:'));
+    final isFlutterProject = await _detectFlutterProject();
 
     final result = await Process.run(
       isFlutterProject ? 'flutter' : 'dart',
@@ -2736,10 +2756,12 @@ class TestAnalyzer {
     return red;
   }
 
+  // Working directory, read once rather than on every path shown in a report
+  late final String _cwd = Directory.current.path;
+
   String _getRelativePath(String fullPath) {
-    final cwd = Directory.current.path;
-    if (fullPath.startsWith(cwd)) {
-      return fullPath.substring(cwd.length + 1);
+    if (fullPath.startsWith(_cwd)) {
+      return fullPath.substring(_cwd.length + 1);
     }
     return fullPath;
   }
@@ -2751,9 +2773,7 @@ class TestAnalyzer {
   }
 
   String _generateBar(double percentage, int width) {
-    final filled = (percentage / 100 * width).round();
-    final empty = width - filled;
-    return '█' * filled + '░' * empty;
+    return FormattingUtils.generateBar(percentage, width);
   }
 
   String _truncate(String str, int maxLength) {
@@ -32,6 +32,7 @@ import 'dart:io';
 
 // CLI argument parsing
 import 'package:args/args.dart';
+import 'package:test_reporter/src/utils/formatting_utils.dart';
 import 'package:test_reporter/src/utils/module_identifier.dart';
 import 'package:test_reporter/src/utils/report_utils.dart';
 
@@ -588,6 +589,14 @@ class FailedTestExtractor {
 
   /// Generate optimized rerun commands for failed tests
   void _generateRerunCommands(List<FailedTest> failedTests) {
+    // Escape each distinct name once; reused by every command below
+    final escapedNames = <String, String>{
+      for (final test in failedTests) test.name: _escapeRegex(test.name),
+    };
+
+    // Collect all commands and emit them with a single print
+    final output = StringBuffer();
+
     if (_args['group-by-file'] as bool) {
       // Group by file and generate batch commands
       final groupedTests = <String, List<FailedTest>>{};
@@ -596,34 +605,34 @@ class FailedTestExtractor {
       }
 
       for (final entry in groupedTests.entries) {
-        final testNames = entry.value.map((t) => t.name).toList();
-        final namePattern = testNames.map(_escapeRegex).join('|');
+        final namePattern =
+            entry.value.map((t) => escapedNames[t.name]!).join('|');
 
-        print('\n# Rerun failed tests in ${entry.key}:');
-        print('flutter test ${entry.key} --name "$namePattern"');
+        output.writeln('\n# Rerun failed tests in ${entry.key}:');
+        output.writeln('flutter test ${entry.key} --name "$namePattern"');
       }
     } else {
       // Generate individual commands
       for (var i = 0; i < failedTests.length; i++) {
         final test = failedTests[i];
-        print('\n# Rerun test ${i + 1}:');
-        print(
-          'flutter test ${test.filePath} --name "${_escapeRegex(test.name)}"',
+        output.writeln('\n# Rerun test ${i + 1}:');
+        output.writeln(
+          'flutter test ${test.filePath} --name "${escapedNames[test.name]}"',
         );
       }
     }
 
     // Generate combined command for all failed tests
     if (failedTests.length > 1) {
-      final allNames =
-          failedTests.map((t) => _escapeRegex(t.name)).toSet().join('|');
-      print('\n# Rerun ALL failed tests:');
-      print('flutter test --name "$allNames"');
+      final allNames = escapedNames.values.join('|');
+      output.writeln('\n# Rerun ALL failed tests:');
+      output.writeln('flutter test --name "$allNames"');
     }
 
-    print(
+    output.write(
       '\n💡 Tip: Copy and paste these commands to rerun specific failed tests',
     );
+    print(output);
   }
 
   /// Automatically rerun failed tests
@@ -788,9 +797,7 @@ class FailedTestExtractor {
         : ModuleIdentifier.getQualifiedModuleName(testPath);
 
     // Format timestamp as HHMM_DDMMYY
-    final simpleTimestamp =
-        '${timestamp.hour.toString().padLeft(2, '0')}${timestamp.minute.toString().padLeft(2, '0')}_'
-        '${timestamp.day.toString().padLeft(2, '0')}${timestamp.month.toString().padLeft(2, '0')}${timestamp.year.toString().substring(2)}';
+    final simpleTimestamp = FormattingUtils.formatTimestamp(timestamp);
 
     // Write unified report
     final reportPath = await ReportUtils.writeUnifiedReport(
@@ -922,10 +929,13 @@ class FailedTestExtractor {
     }
   }
 
+  /// Regex special characters, compiled once for [_escapeRegex]
+  static final _regexSpecialChars = RegExp(r'[.*+?^${}()|[\]\\]');
+
   /// Escape regex special characters
   String _escapeRegex(String input) {
     return input.replaceAllMapped(
-      RegExp(r'[.*+?^${}()|[\]\\]'),
+      _regexSpecialChars,
       (match) => '\\${match.group(0)}',
     );
   }
@@ -272,32 +272,49 @@ FailureType detectFailureType(String error, String stackTrace) {
 
 // Private helper functions for extracting details from error messages
 
+// Extraction patterns (compiled once, shared across calls)
+final _locationPattern = RegExp(r'(.*\.dart:\d+)');
+final _expectedPattern = RegExp(r'[Ee]xpected:?\s*(.+?)(?:\n|$)');
+final _actualPattern = RegExp(r'[Aa]ctual:?\s*(.+?)(?:\n|$)');
+final _nullVariablePattern = RegExp(r"'(\w+)'.*null");
+final _durationPattern = RegExp(r'(\d+)\s*(ms|milliseconds|s|seconds)');
+final _indexPattern = RegExp(r'[Ii]ndex:?\s*(\d+)');
+final _validRangePattern = RegExp(r'0[.]{2}(\d+)');
+final _expectedTypePattern = RegExp(r'type\s+["\x27](\w+)["\x27]\s+is not');
+final _actualTypePattern = RegExp(r'got\s+["\x27](\w+)["\x27]');
+final _pathPattern = RegExp(r'["\x27]([^"\x27]+\.[a-z]+)["\x27]');
+final _endpointPattern = RegExp(r'https?://[^\s]+');
+final _statusCodePattern = RegExp(r'status\s*:?\s*(\d{3})');
+
 String _extractLocation(String stackTrace) {
-  final lines = stackTrace.split('\n');
-  if (lines.isEmpty) return 'unknown';
+  // Only the first line is inspected; avoid splitting the whole trace
+  final newline = stackTrace.indexOf('\n');
+  final firstLine =
+      newline == -1 ? stackTrace : stackTrace.substring(0, newline);
+  // Without a `.dart:` marker there is no location to extract
+  if (!firstLine.contains('.dart:')) return 'unknown';
   // Extract first line of stack trace that contains a file location
-  final match = RegExp(r'(.*\.dart:\d+)').firstMatch(lines.first);
+  final match = _locationPattern.firstMatch(firstLine);
   return match?.group(1) ?? 'unknown';
 }
 
 String? _extractExpected(String error) {
-  final match = RegExp(r'[Ee]xpected:?\s*(.+?)(?:\n|$)').firstMatch(error);
+  final match = _expectedPattern.firstMatch(error);
   return match?.group(1)?.trim();
 }
 
 String? _extractActual(String error) {
-  final match = RegExp(r'[Aa]ctual:?\s*(.+?)(?:\n|$)').firstMatch(error);
+  final match = _actualPattern.firstMatch(error);
   return match?.group(1)?.trim();
 }
 
 String _extractNullVariable(String error) {
-  final match = RegExp(r"'(\w+)'.*null").firstMatch(error);
+  final match = _nullVariablePattern.firstMatch(error);
   return match?.group(1) ?? 'variable';
 }
 
 Duration _extractDuration(String error) {
-  final match =
-      RegExp(r'(\d+)\s*(ms|milliseconds|s|seconds)').firstMatch(error);
+  final match = _durationPattern.firstMatch(error);
   if (match != null) {
     final value = int.parse(match.group(1)!);
     final unit = match.group(2);
@@ -316,23 +333,22 @@ String _extractOperation(String error) {
 }
 
 int _extractIndex(String error) {
-  final match = RegExp(r'[Ii]ndex:?\s*(\d+)').firstMatch(error);
+  final match = _indexPattern.firstMatch(error);
   return match != null ? int.parse(match.group(1)!) : -1;
 }
 
 String _extractValidRange(String error) {
-  final match = RegExp(r'0[.]{2}(\d+)').firstMatch(error);
+  final match = _validRangePattern.firstMatch(error);
   return match != null ? '0..${match.group(1)}' : 'unknown';
 }
 
 String _extractExpectedType(String error) {
-  final match =
-      RegExp(r'type\s+["\x27](\w+)["\x27]\s+is not').firstMatch(error);
+  final match = _expectedTypePattern.firstMatch(error);
   return match?.group(1) ?? 'unknown';
 }
 
 String _extractActualType(String error) {
-  final match = RegExp(r'got\s+["\x27](\w+)["\x27]').firstMatch(error);
+  final match = _actualTypePattern.firstMatch(error);
   return match?.group(1) ?? 'unknown';
 }
 
@@ -344,7 +360,7 @@ String _extractIOOperation(String error) {
 }
 
 String _extractPath(String error) {
-  final match = RegExp(r'["\x27]([^"\x27]+\.[a-z]+)["\x27]').firstMatch(error);
+  final match = _pathPattern.firstMatch(error);
   return match?.group(1) ?? 'unknown';
 }
 
@@ -357,11 +373,11 @@ String _extractNetworkOperation(String error) {
 }
 
 String _extractEndpoint(String error) {
-  final match = RegExp(r'https?://[^\s]+').firstMatch(error);
+  final match = _endpointPattern.firstMatch(error);
   return match?.group(0) ?? 'unknown';
 }
 
 int? _extractStatusCode(String error) {
-  final match = RegExp(r'status\s*:?\s*(\d{3})').firstMatch(error);
+  final match = _statusCodePattern.firstMatch(error);
   return match != null ? int.parse(match.group(1)!) : null;
 }
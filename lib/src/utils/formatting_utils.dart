@@ -28,6 +28,11 @@ class FormattingUtils {
     return '${str.substring(0, maxLength - 3)}...';
   }
 
+  // Prebuilt default bar segments, sliced instead of rebuilt per call
+  static const _barPoolSize = 100;
+  static final _filledPool = '█' * _barPoolSize;
+  static final _emptyPool = '░' * _barPoolSize;
+
   /// Generate visual bar for progress/percentage display
   static String generateBar(
     double percentage,
@@ -37,6 +42,16 @@ class FormattingUtils {
   }) {
     final filled = (percentage / 100 * width).round();
     final empty = width - filled;
+
+    // Fast path: default characters and segments that fit the pools
+    if (filledChar == '█' &&
+        emptyChar == '░' &&
+        filled >= 0 &&
+        empty >= 0 &&
+        width <= _barPoolSize) {
+      return _filledPool.substring(0, filled) + _emptyPool.substring(0, empty);
+    }
+
     return filledChar * filled + emptyChar * empty;
   }
 }
@@ -9,10 +9,16 @@ const _dartExtension = '.dart';
 const _folderSuffix = '-fo';
 const _fileSuffix = '-fi';
 
+// Suffix → path type lookup used when parsing qualified names
+const _suffixMappings = [
+  (_folderSuffix, PathType.folder),
+  (_fileSuffix, PathType.file),
+];
+
 // Validation constants
 const _maxNameLength = 150;
-const _validNamePattern = r'^[a-z0-9\-]+$';
-const _hyphensOnlyPattern = r'^-+$';
+final _validNamePattern = RegExp(r'^[a-z0-9\-]+$');
+final _hyphensOnlyPattern = RegExp(r'^-+$');
 
 /// Path type for module identification
 enum PathType {
@@ -174,12 +180,7 @@ class ModuleIdentifier {
     }
 
     // Try each suffix type
-    final suffixMappings = [
-      (_folderSuffix, PathType.folder),
-      (_fileSuffix, PathType.file),
-    ];
-
-    for (final (suffix, type) in suffixMappings) {
+    for (final (suffix, type) in _suffixMappings) {
       if (qualifiedName.endsWith(suffix)) {
         final baseName =
             qualifiedName.substring(0, qualifiedName.length - suffix.length);
@@ -263,12 +264,12 @@ class ModuleIdentifier {
     }
 
     // Check for valid characters (lowercase letters, numbers, hyphens)
-    if (!RegExp(_validNamePattern).hasMatch(name)) {
+    if (!_validNamePattern.hasMatch(name)) {
       return false;
     }
 
     // Not just hyphens
-    if (RegExp(_hyphensOnlyPattern).hasMatch(name)) {
+    if (_hyphensOnlyPattern.hasMatch(name)) {
       return false;
     }
 
@@ -290,6 +291,8 @@ class ModuleIdentifier {
 
   /// Normalize path by converting Windows backslashes to forward slashes
   static String _normalizePath(String path) {
+    // POSIX paths need no rewrite; avoid allocating a copy
+    if (!path.contains(r'\')) return path;
     return path.replaceAll(r'\', '/');
   }
 }
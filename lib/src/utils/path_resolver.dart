@@ -83,7 +83,7 @@ class PathResolver {
 
     // Handle file: search lib/ tree for matching source file
     if (relativePath.endsWith(_testSuffix)) {
-      final fileName = relativePath.split('/').last;
+      final fileName = _lastSegment(relativePath);
       final sourceFileName = fileName.substring(
             0,
             fileName.length - _testSuffix.length,
@@ -120,50 +120,23 @@ class PathResolver {
 
   /// Search lib/ tree for a file by name
   static String? _findFileInLibTree(String fileName) {
-    final libDir = Directory(_libPrefix);
-    if (!libDir.existsSync()) {
-      return null;
-    }
-
-    try {
-      final files = libDir.listSync(recursive: true, followLinks: false);
-      for (final entity in files) {
-        if (entity is File && entity.path.endsWith('/$fileName')) {
-          return _normalizePath(entity.path);
-        }
-      }
-    } catch (_) {
-      // Ignore filesystem errors
-      return null;
-    }
-
-    return null;
+    final found = _findFirstInTree(
+      _libPrefix,
+      (entity) => entity is File && entity.path.endsWith('/$fileName'),
+    );
+    return found == null ? null : _normalizePath(found.path);
   }
 
   /// Search lib/ tree for a directory by name
   static String? _findDirectoryInLibTree(String dirName) {
-    final libDir = Directory(_libPrefix);
-    if (!libDir.existsSync()) {
-      return null;
-    }
-
-    try {
-      final entities = libDir.listSync(recursive: true, followLinks: false);
-      for (final entity in entities) {
-        if (entity is Directory) {
-          final segments = _normalizePath(entity.path).split('/');
-          if (segments.last == dirName) {
-            // Return with trailing slash
-            return '${_normalizePath(entity.path)}/';
-          }
-        }
-      }
-    } catch (_) {
-      // Ignore filesystem errors
-      return null;
-    }
-
-    return null;
+    final found = _findFirstInTree(
+      _libPrefix,
+      (entity) =>
+          entity is Directory &&
+          _lastSegment(_normalizePath(entity.path)) == dirName,
+    );
+    // Return with trailing slash
+    return found == null ? null : '${_normalizePath(found.path)}/';
   }
 
   /// Infer test path from source path with smart search
@@ -230,42 +203,55 @@ class PathResolver {
 
   /// Search test/ tree for a file by name
   static String? _findFileInTestTree(String fileName) {
-    final testDir = Directory(_testPrefix);
-    if (!testDir.existsSync()) {
-      return null;
-    }
-
-    try {
-      final files = testDir.listSync(recursive: true, followLinks: false);
-      for (final entity in files) {
-        if (entity is File && entity.path.endsWith('/$fileName')) {
-          return _normalizePath(entity.path);
-        }
-      }
-    } catch (_) {
-      // Ignore filesystem errors
-      return null;
-    }
-
-    return null;
+    final found = _findFirstInTree(
+      _testPrefix,
+      (entity) => entity is File && entity.path.endsWith('/$fileName'),
+    );
+    return found == null ? null : _normalizePath(found.path);
   }
 
   /// Search test/ tree for a directory by name
   static String? _findDirectoryInTestTree(String dirName) {
-    final testDir = Directory(_testPrefix);
-    if (!testDir.existsSync()) {
+    final found = _findFirstInTree(
+      _testPrefix,
+      (entity) =>
+          entity is Directory &&
+          _lastSegment(_normalizePath(entity.path)) == dirName,
+    );
+    // Return with trailing slash
+    return found == null ? null : '${_normalizePath(found.path)}/';
+  }
+
+  /// Walk [root] depth-first and return the first entity matching [matches]
+  ///
+  /// Lists one directory at a time and stops at the first hit, instead of
+  /// materializing the whole tree with listSync(recursive: true). Uses an
+  /// explicit stack of directory iterators, so deep trees don't recurse.
+  static FileSystemEntity? _findFirstInTree(
+    String root,
+    bool Function(FileSystemEntity entity) matches,
+  ) {
+    final rootDir = Directory(root);
+    if (!rootDir.existsSync()) {
       return null;
     }
 
     try {
-      final entities = testDir.listSync(recursive: true, followLinks: false);
-      for (final entity in entities) {
+      final stack = [rootDir.listSync(followLinks: false).iterator];
+      while (stack.isNotEmpty) {
+        final entries = stack.last;
+        if (!entries.moveNext()) {
+          stack.removeLast();
+          continue;
+        }
+
+        final entity = entries.current;
+        if (matches(entity)) {
+          return entity;
+        }
         if (entity is Directory) {
-          final segments = _normalizePath(entity.path).split('/');
-          if (segments.last == dirName) {
-            // Return with trailing slash
-            return '${_normalizePath(entity.path)}/';
-          }
+          // Descend before continuing with siblings (pre-order)
+          stack.add(entity.listSync(followLinks: false).iterator);
         }
       }
     } catch (_) {
@@ -370,8 +356,15 @@ class PathResolver {
     return PathCategory.unknown;
   }
 
+  /// Last `/`-separated segment of [path], sliced without splitting the
+  /// whole path into a list
+  static String _lastSegment(String path) =>
+      path.substring(path.lastIndexOf('/') + 1);
+
   /// Normalize path by converting Windows backslashes to forward slashes
   static String _normalizePath(String path) {
+    // POSIX paths need no rewrite; avoid allocating a copy
+    if (!path.contains(r'\')) return path;
     return path.replaceAll(r'\', '/');
   }
 }
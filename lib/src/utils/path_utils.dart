@@ -5,7 +5,11 @@ import 'package:path/path.dart' as p;
 class PathUtils {
   /// Extract meaningful name from test path for reports
   static String extractPathName(String path, {bool stripTest = true}) {
-    var name = path.replaceAll('/', '_').replaceAll(r'\', '_');
+    var name = path.replaceAll('/', '_');
+    // Backslashes only occur in Windows paths; skip the extra pass otherwise
+    if (name.contains(r'\')) {
+      name = name.replaceAll(r'\', '_');
+    }
 
     if (stripTest && name.startsWith('test_')) {
       name = name.substring(5);
@@ -140,12 +140,12 @@ class ReportManager {
     final markdownPath = '$reportDir/$markdownFilename';
     final jsonPath = '$reportDir/$jsonFilename';
 
-    // Write markdown file
-    await File(markdownPath).writeAsString(markdownContent);
-
-    // Write JSON file
+    // Write markdown and JSON files concurrently (independent files)
     final jsonContent = JsonEncoder.withIndent('  ').convert(jsonData);
-    await File(jsonPath).writeAsString(jsonContent);
+    await Future.wait([
+      File(markdownPath).writeAsString(markdownContent),
+      File(jsonPath).writeAsString(jsonContent),
+    ]);
 
     // Cleanup old reports
     await cleanupReports(
@@ -172,33 +172,20 @@ class ReportManager {
       return null;
     }
 
-    // List all markdown files
-    final files = await dir
-        .list()
-        .where((entity) =>
-            entity is File &&
-            entity.path.endsWith('.md') &&
-            entity.path.contains(moduleName))
-        .map((entity) => entity as File)
-        .toList();
-
-    if (files.isEmpty) {
-      return null;
-    }
-
-    // Filter by tool name if provided
-    final filteredFiles = toolName != null
-        ? files.where((f) => f.path.contains(toolName)).toList()
-        : files;
-
-    if (filteredFiles.isEmpty) {
-      return null;
+    // Single pass: filter markdown files and track the newest path
+    // (filename contains timestamp, so the greatest path is the latest)
+    String? latest;
+    await for (final entity in dir.list()) {
+      if (entity is! File) continue;
+      final path = entity.path;
+      if (!path.endsWith('.md') || !path.contains(moduleName)) continue;
+      if (toolName != null && !path.contains(toolName)) continue;
+      if (latest == null || path.compareTo(latest) > 0) {
+        latest = path;
+      }
     }
 
-    // Sort by path (filename contains timestamp, so this works)
-    filteredFiles.sort((a, b) => b.path.compareTo(a.path));
-
-    return filteredFiles.first.path;
+    return latest;
   }
 
   /// Manual cleanup (usually not needed - writeReport does this)
@@ -215,23 +202,26 @@ class ReportManager {
       return;
     }
 
-    // List all files for this module
-    final allFiles = await dir
-        .list()
-        .where((entity) => entity is File && entity.path.contains(moduleName))
-        .map((entity) => entity as File)
-        .toList();
+    // Stream this module's files straight into per-extension groups
+    // (md and json files are paired)
+    final mdFiles = <File>[];
+    final jsonFiles = <File>[];
+    await for (final entity in dir.list()) {
+      if (entity is! File || !entity.path.contains(moduleName)) continue;
+      if (entity.path.endsWith('.md')) {
+        mdFiles.add(entity);
+      } else if (entity.path.endsWith('.json')) {
+        jsonFiles.add(entity);
+      }
+    }
 
-    if (allFiles.isEmpty) {
+    if (mdFiles.isEmpty && jsonFiles.isEmpty) {
       return;
     }
 
-    // Group by extension (md and json files are paired)
-    final mdFiles = allFiles.where((f) => f.path.endsWith('.md')).toList()
-      ..sort((a, b) => b.path.compareTo(a.path)); // Newest first
-
-    final jsonFiles = allFiles.where((f) => f.path.endsWith('.json')).toList()
-      ..sort((a, b) => b.path.compareTo(a.path)); // Newest first
+    // Newest first
+    mdFiles.sort((a, b) => b.path.compareTo(a.path));
+    jsonFiles.sort((a, b) => b.path.compareTo(a.path));
 
     // Keep only the latest N reports
     final mdFilesToDelete = mdFiles.skip(keepCount).toList();
@@ -239,11 +229,21 @@ class ReportManager {
 
     // Delete old files
     if (!dryRun) {
-      for (final file in [...mdFilesToDelete, ...jsonFilesToDelete]) {
-        if (await file.exists()) {
-          await file.delete();
-        }
-      }
+      // Deletions are independent, so issue them concurrently
+      await Future.wait(
+        [...mdFilesToDelete, ...jsonFilesToDelete].map(_deleteIfPresent),
+      );
+    }
+  }
+
+  /// Delete a file, treating one that is already missing as deleted
+  static Future<void> _deleteIfPresent(File file) async {
+    // Delete directly instead of stat-ing first; a file removed
+    // concurrently is already in the desired state
+    try {
+      await file.delete();
+    } on PathNotFoundException {
+      // Already gone
     }
   }
 
@@ -94,12 +94,14 @@ class ReportRegistry {
       return;
     }
 
-    print('\n${"═" * 70}');
-    print('📋 REPORT REGISTRY SUMMARY');
-    print('${"═" * 70}\n');
-
-    print('Total Reports: ${_reports.length}');
-    print('');
+    // Collect all lines and emit them with a single print call
+    final lines = <String>[
+      '\n${"═" * 70}',
+      '📋 REPORT REGISTRY SUMMARY',
+      '${"═" * 70}\n',
+      'Total Reports: ${_reports.length}',
+      '',
+    ];
 
     // Group by tool
     final byTool = <String, List<ReportEntry>>{};
@@ -108,13 +110,16 @@ class ReportRegistry {
     }
 
     for (final entry in byTool.entries) {
-      print('${entry.key}:');
+      lines.add('${entry.key}:');
       for (final report in entry.value) {
-        print('  📄 ${report.reportPath}');
-        print('     Module: ${report.moduleName} | Type: ${report.reportType}');
+        lines
+          ..add('  📄 ${report.reportPath}')
+          ..add('     Module: ${report.moduleName} | Type: ${report.reportType}');
       }
-      print('');
+      lines.add('');
     }
+
+    print(lines.join('\n'));
   }
 
   /// Clear all registered reports
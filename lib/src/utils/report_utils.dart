@@ -13,9 +13,8 @@ class ReportUtils {
     final reportsRoot = ReportManager.reportsRoot;
     final reportDir = Directory(p.join(currentDir.path, reportsRoot));
 
-    if (!await reportDir.exists()) {
-      await reportDir.create(recursive: true);
-    }
+    // create(recursive: true) is a no-op for existing directories
+    await reportDir.create(recursive: true);
 
     return reportDir.path;
   }
@@ -66,6 +65,11 @@ class ReportUtils {
         ? [subdirectory]
         : ['reliability', 'quality', 'failures', 'suite'];
 
+    // Filename prefixes per pattern: {pathName}_{pattern}@ (built once)
+    final matchPrefixes = [
+      for (final pattern in prefixPatterns) (pattern, '${pathName}_$pattern@'),
+    ];
+
     for (final subdir in subdirs) {
       final dir = Directory(p.join(reportDir, subdir));
       if (!await dir.exists()) continue;
@@ -76,13 +80,11 @@ class ReportUtils {
       await for (final file in dir.list()) {
         if (file is! File) continue;
 
-        final fileName = file.path.split('/').last;
+        final fileName = p.basename(file.path);
         if (verbose) print('  🔎 Checking file: $fileName in $subdir');
 
-        for (final pattern in prefixPatterns) {
+        for (final (pattern, matchPattern) in matchPrefixes) {
           // Match pattern: {pathName}_{pattern}@{timestamp}.{ext}
-          final matchPattern = '${pathName}_$pattern@';
-
           if (verbose) {
             print('    Looking for pattern: $matchPattern');
           }
@@ -103,7 +105,7 @@ class ReportUtils {
         // Group files by timestamp (extract from @timestamp.ext pattern)
         final filesByTimestamp = <String, List<File>>{};
         for (final file in files) {
-          final fileName = file.path.split('/').last;
+          final fileName = p.basename(file.path);
           // Extract timestamp: modulename_pattern@HHMM_DDMMYY.ext
           final atIndex = fileName.lastIndexOf('@');
           final dotIndex = fileName.lastIndexOf('.');
@@ -144,10 +146,7 @@ class ReportUtils {
 
   /// Create directory if it doesn't exist
   static Future<void> ensureDirectoryExists(String path) async {
-    final dir = Directory(path);
-    if (!await dir.exists()) {
-      await dir.create(recursive: true);
-    }
+    await Directory(path).create(recursive: true);
   }
 
   /// Get full report path for a module
@@ -178,12 +177,9 @@ class ReportUtils {
       _ => 'suite',
     };
 
-    // Create subdirectory if it doesn't exist
+    // Create subdirectory (and report root) in one call if missing
     final subdirPath = p.join(reportDir, subdir);
-    final subdirDir = Directory(subdirPath);
-    if (!await subdirDir.exists()) {
-      await subdirDir.create(recursive: true);
-    }
+    await Directory(subdirPath).create(recursive: true);
 
     final suffixPart = suffix.isNotEmpty ? '_$suffix' : '';
     return p.join(subdirPath, '${moduleName}_report$suffixPart@$timestamp.md');
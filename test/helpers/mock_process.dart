@@ -191,16 +191,16 @@ class MockProcessManager {
   }) async {
     final key = _CommandKey(command, args);
 
-    if (!_mocks.containsKey(key)) {
+    final mock = _mocks[key];
+    if (mock == null) {
       throw StateError(
         'No mock registered for command: $command ${args.join(" ")}\n'
         'Available mocks: ${_mocks.keys.map((k) => '${k.command} ${k.args.join(" ")}').join(", ")}',
       );
     }
 
-    _invocations[key] = (_invocations[key] ?? 0) + 1;
+    _invocations.update(key, (count) => count + 1, ifAbsent: () => 1);
 
-    final mock = _mocks[key]!;
     if (mock.runResult == null) {
       throw StateError(
         'Mock registered for Process.start(), but Process.run() was called',
@@ -222,15 +222,15 @@ class MockProcessManager {
   }) async {
     final key = _CommandKey(command, args);
 
-    if (!_mocks.containsKey(key)) {
+    final mock = _mocks[key];
+    if (mock == null) {
       throw StateError(
         'No mock registered for command: $command ${args.join(" ")}',
       );
     }
 
-    _invocations[key] = (_invocations[key] ?? 0) + 1;
+    _invocations.update(key, (count) => count + 1, ifAbsent: () => 1);
 
-    final mock = _mocks[key]!;
     if (mock.startProcess == null) {
       throw StateError(
         'Mock registered for Process.run(), but Process.start() was called',
@@ -340,6 +340,16 @@ void main() {
         expect(bar.substring(50), equals('░' * 50));
       });
 
+      test('should handle width beyond prebuilt segments', () {
+        final bar = FormattingUtils.generateBar(25, 200);
+        expect(bar, equals('█' * 50 + '░' * 150));
+      });
+
+      test('should handle percentages outside 0-100', () {
+        expect(FormattingUtils.generateBar(150, 10), equals('█' * 15));
+        expect(FormattingUtils.generateBar(-50, 10), equals('░' * 15));
+      });
+
       test('should round percentage to nearest integer', () {
         // 33.33% of 10 = 3.333 should round to 3
         expect(